@@ -0,0 +1,82 @@
+"""
+Headless benchmark for the snake game logic. Runs the game without Tk and
+reports how many steps per second it manages.
+
+Usage: python3 bench.py --ticks 1e6
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from configuration import Configuration
+from game import Game, DIR_NAMES
+
+
+def bench(ticks, obstacles=True, turn_every=10, seed=None):
+    """
+    Run a wrap-walls, invincible game (so it never ends) for a number of
+    steps, turning in a random direction every few steps. The game is reset
+    whenever the snake has filled the board and no food can be placed.
+    Messages the game prints (e.g. when no free cell is left) are discarded
+    so they neither clutter the output nor add terminal I/O to the timing.
+
+    Parameters
+    ----------
+    ticks : int
+        Number of steps to run.
+    obstacles : boolean
+        Generate obstacles if true.
+    turn_every : int
+        Number of steps between random direction changes.
+    seed : int | None
+        Seed for the random direction changes.
+
+    Returns
+    -------
+    float
+        Elapsed wall-clock seconds.
+    """
+    rng = random.Random(seed)
+    game = Game(Configuration(), obstacles_enabled=obstacles,
+                wrap_walls=True, invincible=True)
+
+    done = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        while done < ticks:
+            if game.food_position is None:
+                game.reset()
+            game.change_direction(rng.choice(DIR_NAMES))
+            done = done + game.run(min(turn_every, ticks - done))
+        elapsed = time.perf_counter() - start
+    return elapsed
+
+
+def main():
+    """
+    Parse command line arguments, run the benchmark and print the result.
+
+    Returns
+    -------
+    None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--ticks", type=float, default=1e5,
+                        help="number of steps to run (default 1e5)")
+    parser.add_argument("--no-obstacles", action="store_true",
+                        help="run without obstacles")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed for the random direction changes")
+    args = parser.parse_args()
+
+    ticks = int(args.ticks)
+    elapsed = bench(ticks, obstacles=not args.no_obstacles, seed=args.seed)
+    print(f"{ticks} steps in {elapsed:.3f} s "
+          f"({ticks / elapsed:,.0f} steps/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,13 @@
 Configuration container for the snake game.
 """
 
+from typing import NamedTuple
 
-class Configuration:
+
+class Configuration(NamedTuple):
     """
-    Configuration container for the snake game.
+    Configuration container for the snake game. Settings are immutable once
+    created.
 
     Attributes
     ----------
@@ -23,21 +26,9 @@ class Configuration:
         Fraction of board cells targeted to become obstacle cells.
     """
 
-    def __init__(
-        self,
-        grid_width=15,
-        grid_height=15,
-        cell_size=40,
-        step_delay=150,
-        powerup_chance=0.01,
-        obstacle_density=0.2,
-    ):
-        """
-        Set up the game configuration, default values incorporated.
-        """
-        self.grid_width = grid_width
-        self.grid_height = grid_height
-        self.cell_size = cell_size
-        self.step_delay = step_delay
-        self.powerup_chance = powerup_chance
-        self.obstacle_density = obstacle_density
+    grid_width: int = 15
+    grid_height: int = 15
+    cell_size: int = 40
+    step_delay: int = 150
+    powerup_chance: float = 0.01
+    obstacle_density: float = 0.2
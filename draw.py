@@ -2,10 +2,15 @@
 Drawing layer for the snake game using Tkinter.
 """
 
+from collections import deque
+
 
 class Draw:
     """
-    Drawing layer for the Snake game.
+    Drawing layer for the Snake game. Canvas items are created once and then
+    moved with coords() on later frames, so a normal snake step only touches
+    the items that actually changed. Obstacles are tagged "static" and drawn
+    once per game below the "dynamic" snake, food and power-up items.
 
     Attributes
     ----------
@@ -16,6 +21,8 @@ class Draw:
 
     Methods
     -------
+    set_game(game)
+        Switch to drawing a new game.
     draw_obstacles()
         Draw all obstacle cells.
     draw_food()
@@ -25,7 +32,7 @@ class Draw:
     draw_snake()
         Draw the snake body and head.
     draw()
-        Draw the entire game on the canvas.
+        Draw the moving parts of the game on the canvas.
     """
 
     def __init__(self, canvas, game):
@@ -35,104 +42,295 @@ class Draw:
         self.canvas = canvas
         self.game = game
 
+        # Pixel offset of every grid line, so cell rects are table lookups
+        cfg = game.config
+        s = cfg.cell_size
+        n = max(cfg.grid_width, cfg.grid_height) + 1
+        self._px = tuple(range(0, n * s, s))
+
+        # Persistent canvas items, created on first draw
+        self._snake_items = deque()
+        self._snake_pool = []
+        self._snake_head = None
+        self._snake_moves = None
+        self._snake_version = None
+        self._food_item = None
+        self._powerup_item = None
+        self._powerup_text = None
+
+    def set_game(self, game):
+        """
+        Switch to drawing a new game on the same canvas. Snake items are kept
+        hidden for reuse instead of being deleted.
+
+        Parameters
+        ----------
+        game : Game
+            The new Game object to draw.
+
+        Returns
+        -------
+        None
+        """
+        self.game = game
+        self._release_snake_items()
+        self._snake_head = None
+        self._snake_moves = None
+        self._snake_version = None
+        for item in (self._food_item, self._powerup_item, self._powerup_text):
+            if item is not None:
+                self.canvas.itemconfigure(item, state="hidden")
+
+    def _snake_item(self, coords):
+        """
+        Get a visible snake oval at the given coordinates, reusing a hidden
+        item from the pool when there is one.
+
+        Parameters
+        ----------
+        coords : tuple[float, float, float, float]
+            Bounding box of the oval.
+
+        Returns
+        -------
+        int
+            Canvas item id.
+        """
+        if self._snake_pool:
+            item = self._snake_pool.pop()
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfigure(item, state="normal")
+            return item
+        return self.canvas.create_oval(
+            *coords, fill="#00ff66", outline="", tags="dynamic"
+        )
+
+    def _release_snake_items(self):
+        """
+        Hide all snake ovals and return them to the pool.
+
+        Returns
+        -------
+        None
+        """
+        for item in self._snake_items:
+            self.canvas.itemconfigure(item, state="hidden")
+        self._snake_pool.extend(self._snake_items)
+        self._snake_items.clear()
+
+    def _snake_coords(self, cell, head):
+        """
+        Compute the oval coordinates of a snake segment.
+
+        Parameters
+        ----------
+        cell : tuple[int, int]
+            (x, y) cell coordinates.
+        head : boolean
+            True for the (slightly larger) head segment.
+
+        Returns
+        -------
+        tuple[float, float, float, float]
+            Bounding box of the oval.
+        """
+        x, y = cell
+        s = self.game.config.cell_size
+        cx, cy = self._px[x] + s / 2, self._px[y] + s / 2
+
+        # head is slightly larger
+        if head:
+            r = s * 0.5
+        else:
+            r = s * 0.4
+        return cx - r, cy - r, cx + r, cy + r
+
+    def _compute_obstacle_rects(self):
+        """
+        Merge obstacle cells into as few rectangles as possible. Contiguous
+        cells in a row form a run, and identical runs in consecutive rows are
+        stacked into one rectangle (so a 2x2 block becomes a single rect).
+
+        Returns
+        -------
+        list[tuple[int, int, int, int]]
+            (x_start, y_start, x_end, y_end) cell ranges, ends inclusive.
+        """
+        rects = []
+        # (x_start, x_end) -> index in rects of a rectangle ending on the
+        # previous row
+        open_runs = {}
+        cells = sorted(self.game.obstacles, key=lambda c: (c[1], c[0]))
+        i = 0
+        while i < len(cells):
+            x_start, y = cells[i]
+            x_end = x_start
+            i = i + 1
+            while i < len(cells) and cells[i] == (x_end + 1, y):
+                x_end = x_end + 1
+                i = i + 1
+
+            key = (x_start, x_end)
+            idx = open_runs.get(key)
+            if idx is not None and rects[idx][3] == y - 1:
+                rects[idx] = (x_start, rects[idx][1], x_end, y)
+            else:
+                open_runs[key] = len(rects)
+                rects.append((x_start, y, x_end, y))
+        return rects
+
     def draw_obstacles(self):
         """
-        Draw all obstacle cells as gray rectangles on the canvas.
+        Draw all obstacle cells as gray rectangles on the static layer,
+        replacing the obstacles of any previous game. Adjacent cells are
+        merged into larger rectangles. Obstacles never move during a game, so
+        this only needs to run once, when the game starts.
 
         Returns
         -------
         None
         """
-        for c in self.game.obstacles:
-            x, y = c
-            s = self.game.config.cell_size
-            x1, y1, x2, y2 = x * s, y * s, x * s + s, y * s + s
-            self.canvas.create_rectangle(
-                x1, y1, x2, y2, fill="#666666", outline=""
+        self.canvas.delete("static")
+        if not self.game.obstacles_enabled:
+            return
+        px = self._px
+        create_rectangle = self.canvas.create_rectangle
+        for x_start, y_start, x_end, y_end in self._compute_obstacle_rects():
+            x1, y1 = px[x_start], px[y_start]
+            x2, y2 = px[x_end + 1], px[y_end + 1]
+            create_rectangle(
+                x1, y1, x2, y2, fill="#666666", outline="", tags="static"
             )
+        self.canvas.tag_lower("static")
 
     def draw_food(self):
         """
-        Draw the food as a red circle on the canvas
+        Draw the food as a red circle on the canvas. The item is hidden when
+        there is no food.
 
         Returns
         -------
         None
         """
+        if self._food_item is None:
+            self._food_item = self.canvas.create_oval(
+                0,
+                0,
+                0,
+                0,
+                fill="#ff4d4d",
+                outline="",
+                state="hidden",
+                tags="dynamic",
+            )
         if self.game.food_position is None:
+            self.canvas.itemconfigure(self._food_item, state="hidden")
             return
         x, y = self.game.food_position
-        s = self.game.config.cell_size
-        x1, y1, x2, y2 = x * s, y * s, x * s + s, y * s + s
-        self.canvas.create_oval(
-            x1 + 6, y1 + 6, x2 - 6, y2 - 6, fill="#ff4d4d", outline=""
-        )
+        px = self._px
+        x1, y1, x2, y2 = px[x], px[y], px[x + 1], px[y + 1]
+        self.canvas.coords(self._food_item, x1 + 6, y1 + 6, x2 - 6, y2 - 6)
+        self.canvas.itemconfigure(self._food_item, state="normal")
 
     def draw_powerup(self):
         """
-        Draw the power-up item as a smaller purple circle.
+        Draw the power-up item as a smaller purple circle. The item is hidden
+        when there is no power-up.
 
         Returns
         -------
         None
         """
+        if self._powerup_item is None:
+            self._powerup_item = self.canvas.create_oval(
+                0,
+                0,
+                0,
+                0,
+                fill="#800080",
+                outline="white",
+                width=1,
+                state="hidden",
+                tags="dynamic",
+            )
+            self._powerup_text = self.canvas.create_text(
+                0,
+                0,
+                text="2x",
+                fill="black",
+                font=("Arial", 8, "bold"),
+                state="hidden",
+                tags="dynamic",
+            )
         if self.game.powerup_position is None:
+            self.canvas.itemconfigure(self._powerup_item, state="hidden")
+            self.canvas.itemconfigure(self._powerup_text, state="hidden")
             return
         x, y = self.game.powerup_position
-        s = self.game.config.cell_size
-        x1, y1, x2, y2 = x * s, y * s, x * s + s, y * s + s
-        self.canvas.create_oval(
-            x1 + 10,
-            y1 + 10,
-            x2 - 10,
-            y2 - 10,
-            fill="#800080",
-            outline="white",
-            width=1,
-        )
-        self.canvas.create_text(
-            (x1 + x2) / 2,
-            (y1 + y2) / 2,
-            text="2x",
-            fill="black",
-            font=("Arial", 8, "bold"),
+        px = self._px
+        x1, y1, x2, y2 = px[x], px[y], px[x + 1], px[y + 1]
+        self.canvas.coords(
+            self._powerup_item, x1 + 10, y1 + 10, x2 - 10, y2 - 10
         )
+        self.canvas.coords(self._powerup_text, (x1 + x2) / 2, (y1 + y2) / 2)
+        self.canvas.itemconfigure(self._powerup_item, state="normal")
+        self.canvas.itemconfigure(self._powerup_text, state="normal")
 
     def draw_snake(self):
         """
-        Draw the snake as green circles. The head is slightly larger than body segments.
+        Draw the snake as green circles. The head is slightly larger than body
+        segments. When the game's move counter shows exactly one move since
+        the last frame and no new snake was assigned, the old head is shrunk
+        to body size and the tail item is recycled as the new head (or another
+        item is taken from the pool if the snake grew). Any other change, e.g.
+        after a skipped frame, lays the snake out again from pooled items.
 
         Returns
         -------
         None
         """
+        snake = self.game.snake
+        items = self._snake_items
+        moves = self.game.moves
+        version = self.game.snake_version
 
-        s = self.game.config.cell_size
-        for i in range(len(self.game.snake)):
-            x, y = self.game.snake[i]
-            cx, cy = x * s + s / 2, y * s + s / 2
+        # Nothing changed since the last frame
+        if moves == self._snake_moves and version == self._snake_version:
+            return
 
-            # head is slightly larger
-            if i == 0:
-                r = s * 0.5
-            else:
-                r = s * 0.4
-            self.canvas.create_oval(
-                cx - r, cy - r, cx + r, cy + r, fill="#00ff66", outline=""
+        growth = len(snake) - len(items)
+        if (items and version == self._snake_version
+                and moves == self._snake_moves + 1 and growth in (0, 1)):
+            # Old head becomes a body segment
+            self.canvas.coords(
+                items[0], *self._snake_coords(self._snake_head, False)
             )
+            if growth == 0:
+                item = items.pop()
+                self.canvas.coords(item, *self._snake_coords(snake[0], True))
+            else:
+                item = self._snake_item(self._snake_coords(snake[0], True))
+            items.appendleft(item)
+        else:
+            self._release_snake_items()
+            for i, cell in enumerate(snake):
+                items.append(
+                    self._snake_item(self._snake_coords(cell, i == 0))
+                )
+        self._snake_head = snake[0]
+        self._snake_moves = moves
+        self._snake_version = version
 
     def draw(self):
         """
-        Clears the canvas, sets background, and then draws obstacles, food, power-ups, and the snake.
+        Draws food, power-ups, and the snake, only updating the items that
+        changed since the last frame. Obstacles are drawn separately by
+        draw_obstacles().
 
         Returns
         -------
         None
         """
-        self.canvas.delete("all")
-        self.canvas.configure(bg="black")
-        if self.game.obstacles_enabled:
-            self.draw_obstacles()
         self.draw_food()
         self.draw_powerup()
-        self.draw_snake()
\ No newline at end of file
+        self.draw_snake()
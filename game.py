@@ -3,12 +3,117 @@ Main game logic for the snake game.
 """
 
 import random
+from collections import deque
 
 
-# Creating dictionary for easy lookup of direction and opposite directions
-# for bouncing
-DIR = {"Up": (0, -1), "Down": (0, 1), "Left": (-1, 0), "Right": (1, 0)}
-OPP_DIR = {"Up": "Down", "Down": "Up", "Left": "Right", "Right": "Left"}
+# Directions are stored as ints indexing the tables below. DX/DY give the
+# step for each direction and OPP the opposite direction for bouncing.
+UP, DOWN, LEFT, RIGHT = 0, 1, 2, 3
+DX = (0, 0, -1, 1)
+DY = (-1, 1, 0, 0)
+OPP = (DOWN, UP, RIGHT, LEFT)
+
+# Translation between key names and direction ints
+DIR_NAMES = ("Up", "Down", "Left", "Right")
+DIR_INDEX = {"Up": UP, "Down": DOWN, "Left": LEFT, "Right": RIGHT}
+
+
+def _dilate(rows):
+    """
+    Grow every marked cell in a list of row bitmasks to its 3x3
+    neighborhood using shifted ORs.
+
+    Parameters
+    ----------
+    rows : list[int]
+        One bitmask per grid row, bit x set for marked cells.
+
+    Returns
+    -------
+    list[int]
+        Row bitmasks marking every cell within 1 block of a marked cell. Bits
+        beyond the right edge of the board may be set and should be masked
+        off by the caller.
+    """
+    horizontal = [r | (r << 1) | (r >> 1) for r in rows]
+    out = []
+    for y in range(len(horizontal)):
+        mask = horizontal[y]
+        if y > 0:
+            mask |= horizontal[y - 1]
+        if y + 1 < len(horizontal):
+            mask |= horizontal[y + 1]
+        out.append(mask)
+    return out
+
+
+def move_head(head, d, gw, gh, wrap_walls, invincible, obstacles, snake_set):
+    """
+    Movement and collision kernel for one step. Works only on plain ints,
+    tuples and sets so it can be driven without a Game (e.g. headless runs)
+    and compiled separately if needed.
+
+    Parameters
+    ----------
+    head : tuple[int, int]
+        Current head cell.
+    d : int
+        Direction to move in (UP, DOWN, LEFT, RIGHT).
+    gw, gh : int
+        Board width and height.
+    wrap_walls : boolean
+        Snake wraps around walls if true.
+    invincible : boolean
+        Walls and obstacles bounce the snake and self-collisions are ignored
+        if true.
+    obstacles : set[tuple[int, int]]
+        Obstacle cells.
+    snake_set : set[tuple[int, int]]
+        Cells covered by the snake.
+
+    Returns
+    -------
+    tuple[tuple[int, int] | None, int, boolean]
+        New head cell (None if the snake cannot move this step), direction
+        after any bounce, and True if the snake collided and the game is over.
+    """
+    nx, ny = head[0] + DX[d], head[1] + DY[d]
+    if wrap_walls:
+        nx = nx % gw
+        ny = ny % gh
+    new_head = (nx, ny)
+
+    # Walls (never hit with wrap_walls) and obstacles either end the game
+    # or, when invincible, bounce the snake back the way it came.
+    # Bounds checks are inlined as this runs every step
+    if not (0 <= nx < gw and 0 <= ny < gh):
+        if not invincible:
+            return None, d, True
+        bounce_dir = OPP[d]
+        bx, by = head[0] + DX[bounce_dir], head[1] + DY[bounce_dir]
+        if not (0 <= bx < gw and 0 <= by < gh):
+            return None, d, False
+        d = bounce_dir
+        new_head = (bx, by)
+
+    if new_head in obstacles:
+        if not invincible:
+            return None, d, True
+        bounce_dir = OPP[d]
+        bx, by = head[0] + DX[bounce_dir], head[1] + DY[bounce_dir]
+        if wrap_walls:
+            bx = bx % gw
+            by = by % gh
+        bounce_cell = (bx, by)
+        if 0 <= bx < gw and 0 <= by < gh and bounce_cell not in obstacles:
+            d = bounce_dir
+            new_head = bounce_cell
+
+    # If snake hits itself
+    if new_head in snake_set and not invincible:
+        return None, d, True
+
+    return new_head, d, False
 
 
 class Game:
@@ -22,15 +127,21 @@ class Game:
     config : Configuration
         Configuration object wrapper with board settings.
     obstacles_enabled : boolean
-        Allows generation of obstacles consisting of randomly dispersed 2x2
-        blocks with overlap allowed.
+        Allows generation of obstacles consisting of randomly dispersed,
+        non-overlapping 2x2 blocks.
     wrap_walls : boolean
         Allows snake to wrap around walls and appear on other side if true.
     invincible : boolean
         Allows snake to overlap itself and collisions with walls/obstacles
         result in a 180 degree turn if true
-    snake : list[tuple[int, int]]
-        List of (x, y) cells making up the snake with head at first position.
+    snake : deque[tuple[int, int]]
+        Deque of (x, y) cells making up the snake with head at first position.
+    snake_set : set[tuple[int, int]]
+        Set of cells covered by the snake for fast collision checks.
+    _segment_counts : dict[tuple[int, int], int]
+        Number of snake segments on each covered cell. In invincible mode the
+        snake can overlap itself, so a cell only leaves snake_set once its
+        count drops to 0.
     new_growth : int
         Number of segments the snake needs to grow (2 for power up, 1 for
         normal food)
@@ -44,10 +155,21 @@ class Game:
         Coordinates containing a power-up, or None if no power-up.
     obstacles : set[tuple[int, int]]
         Set of cells that are occupied by obstacles.
+    moves : int
+        Number of steps the snake has moved one cell, so the drawing layer
+        can tell how far the snake moved since its last frame.
+    snake_version : int
+        Goes up by one every time a new snake is assigned, so the drawing
+        layer knows to lay the snake out again.
+    row_bits : list[int]
+        One bitmask per grid row with bit x set where the snake covers cell
+        (x, y). Kept up to date incrementally as the snake moves.
     direction : str
-        Current direction ("Up", "Down", "Left", "Right").
+        Current direction ("Up", "Down", "Left", "Right"). Stored internally
+        as an int in _dir.
     next_direction : str
-        Next snake direction input by player applied at next step.
+        Next snake direction input by player applied at next step. Stored
+        internally as an int in _next_dir.
     input_locked : boolean
         Locks direction changes until next step.
 
@@ -66,8 +188,36 @@ class Game:
         Generate random 2x2 obstacle blocks on the board.
     step()
         Advance the game by one step.
+    run(n_steps)
+        Advance the game by several steps without any drawing.
     """
 
+    # Fixed attribute set, no per-instance __dict__
+    __slots__ = (
+        "config",
+        "obstacles_enabled",
+        "wrap_walls",
+        "invincible",
+        "_snake",
+        "moves",
+        "snake_version",
+        "snake_set",
+        "_segment_counts",
+        "new_growth",
+        "score",
+        "game_over",
+        "food_position",
+        "powerup_position",
+        "obstacles",
+        "row_bits",
+        "_static_blocked",
+        "_candidate_pool",
+        "_dir",
+        "_next_dir",
+        "input_locked",
+        "_rng",
+    )
+
     def __init__(self, config, obstacles_enabled=True,
                  wrap_walls=False, invincible=False):
         """
@@ -81,6 +231,10 @@ class Game:
         self.powerup_position = None
         self.obstacles = set()
         self.input_locked = False
+        self.moves = 0
+        self.snake_version = 0
+        # One random number generator shared by everything in the game
+        self._rng = random.Random()
         self.reset()
 
     def reset(self):
@@ -101,9 +255,12 @@ class Game:
         # the right.
         x0 = gw // 2
         y0 = gh // 2
-        self.snake = [(x0, y0), (x0 - 1, y0), (x0 - 2, y0)]
-        self.direction = "Right"
-        self.next_direction = "Right"
+        self.row_bits = [0] * gh
+        self._static_blocked = [0] * gh
+        self._candidate_pool = []
+        self.snake = deque([(x0, y0), (x0 - 1, y0), (x0 - 2, y0)])
+        self._dir = RIGHT
+        self._next_dir = RIGHT
 
         # Initial snake growth, score and game state
         self.new_growth = 0
@@ -118,6 +275,49 @@ class Game:
         self.food_position = self.random_empty_cell()
         self.powerup_position = None
 
+    @property
+    def snake(self):
+        """
+        Deque of (x, y) cells making up the snake with head at first
+        position. Assigning a new snake also refreshes snake_set, the
+        segment counts and row_bits.
+        """
+        return self._snake
+
+    @snake.setter
+    def snake(self, cells):
+        self._snake = deque(cells)
+        self.snake_set = set(self._snake)
+        self._segment_counts = {}
+        for cell in self._snake:
+            self._segment_counts[cell] = self._segment_counts.get(cell, 0) + 1
+        self.snake_version = self.snake_version + 1
+        self.row_bits = [0] * self.config.grid_height
+        for x, y in self._snake:
+            self.row_bits[y] |= 1 << x
+
+    @property
+    def direction(self):
+        """
+        Current direction ("Up", "Down", "Left", "Right").
+        """
+        return DIR_NAMES[self._dir]
+
+    @direction.setter
+    def direction(self, name):
+        self._dir = DIR_INDEX[name]
+
+    @property
+    def next_direction(self):
+        """
+        Next snake direction input by player applied at next step.
+        """
+        return DIR_NAMES[self._next_dir]
+
+    @next_direction.setter
+    def next_direction(self, name):
+        self._next_dir = DIR_INDEX[name]
+
     def is_inside(self, cell):
         """
         Check whether a given cell is inside the board boundaries.
@@ -135,10 +335,7 @@ class Game:
         x, y = cell
         gw = self.config.grid_width
         gh = self.config.grid_height
-        if 0 <= x < gw and 0 <= y < gh:
-            return True
-        else:
-            return False
+        return 0 <= x < gw and 0 <= y < gh
 
     def change_direction(self, new_dir):
         """
@@ -154,76 +351,118 @@ class Game:
         -------
         None
         """
-        if new_dir not in DIR:
+        d = DIR_INDEX.get(new_dir)
+        if d is None:
             return
         if self.input_locked:
             return
         # If same direction as current direction, disregard
-        if new_dir == self.direction:
+        if d == self._dir:
             return
         # No 180 degree turns
-        if OPP_DIR[new_dir] == self.direction:
+        if OPP[d] == self._dir:
             return
 
-        self.next_direction = new_dir
+        self._next_dir = d
 
         # lock new input until next step
         self.input_locked = True
 
+    def _is_spawnable(self, cell):
+        """
+        Check whether food or a power-up may currently be placed on a cell,
+        i.e. the cell and its neighbors hold no snake, obstacle, food or
+        power-up.
+
+        Parameters
+        ----------
+        cell : tuple[int, int]
+            (x, y) cell coordinates.
+
+        Returns
+        -------
+        boolean
+            True if the cell is a valid spawn location.
+        """
+        x, y = cell
+        if self._static_blocked[y] >> x & 1:
+            return False
+        # Columns x-1 to x+1
+        columns = (0b111 << x) >> 1
+        for ny in range(max(y - 1, 0), min(y + 2, len(self.row_bits))):
+            if self.row_bits[ny] & columns:
+                return False
+        for other in (self.food_position, self.powerup_position):
+            if (other is not None and abs(other[0] - x) <= 1
+                    and abs(other[1] - y) <= 1):
+                return False
+        return True
+
+    def _refill_candidate_pool(self):
+        """
+        Refill the candidate pool with every currently valid spawn cell in
+        random order.
+
+        Returns
+        -------
+        None
+        """
+        gw, gh = self.config.grid_width, self.config.grid_height
+
+        # Snake rows plus food and power-up cells
+        blocked = list(self.row_bits)
+        for cell in (self.food_position, self.powerup_position):
+            if cell is not None:
+                blocked[cell[1]] |= 1 << cell[0]
+
+        # Enforce 1-block radius empty around the cell. Cells next to
+        # obstacles were ruled out once up front.
+        forbidden = _dilate(blocked)
+        static_blocked = self._static_blocked
+        candidates = (1 << (gw - 1)) - 1
+
+        pool = self._candidate_pool
+        for y in range(gh - 1):
+            free = candidates & ~(forbidden[y] | static_blocked[y])
+            while free:
+                low = free & -free
+                free = free ^ low
+                pool.append((low.bit_length() - 1, y))
+        self._rng.shuffle(pool)
+
     def random_empty_cell(self):
         """
         Chooses a cell at random for generating food or power-ups. Cells with
         obstacles or currently occupied by the snake are invalid. Additionally,
         the generated food/power-up will have a 1 cell radius around it empty.
 
+        Cells are drawn from a shuffled pool of candidates that is only
+        rebuilt (a full board scan) once it runs dry, so most calls only check
+        a few cells. Candidates that are no longer valid are dropped.
+
         Returns
         -------
         tuple[int, int] or None
             A random empty cell satisfying the constraints, or None if no such
             cell exists.
         """
-
-        # snake and obstacle cells are invalid
-        occupied = set(self.snake)
-        for cell in self.obstacles:
-            occupied.add(cell)
-
-        # food and power-up cells are invalid
-        if self.food_position is not None:
-            occupied.add(self.food_position)
-        if self.powerup_position is not None:
-            occupied.add(self.powerup_position)
-
-        # initialize list of candidate cells.
-        cells = []
-        for x in range(self.config.grid_width-1):
-            for y in range(self.config.grid_height-1):
-                cell = (x, y)
-                # check if cell is occupied
-                if cell in occupied:
-                    continue
-
-                # Enforce 1-block radius empty around the cell
-                valid = True
-                for dx in (-1, 0, 1):
-                    for dy in (-1, 0, 1):
-                        nx, ny = x + dx, y + dy
-                        neighbor = (nx, ny)
-                        if neighbor in occupied:
-                            valid = False
-                            break
-                    if not valid:
-                        break
-                if valid:
-                    cells.append(cell)
-        if len(cells) == 0:
-            print("No valid cells found.")
-            return None
-        return random.choice(cells)
+        pool = self._candidate_pool
+        refilled = False
+        while True:
+            while pool:
+                cell = pool.pop()
+                if self._is_spawnable(cell):
+                    return cell
+            if refilled:
+                break
+            self._refill_candidate_pool()
+            refilled = True
+        print("No valid cells found.")
+        return None
 
     def generate_obstacles(self):
         """
-        Generate random 2×2 obstacle blocks on the board with overlap allowed.
+        Generate random, non-overlapping 2×2 obstacle blocks on the board.
         Each new game resets and generates new obstacles. Obstacles will not be
         generated in the first 6x3 cells in front of the snake to prevent
         immediate loss. Obstacles will be generated with a random placement
@@ -255,9 +494,10 @@ class Game:
                 invalid_cells.add((nx, ny))
 
         # randomly place obstacle blocks indexing by the bottom left block.
+        randrange = self._rng.randrange
         for blocks in range(block_number):
-            x = random.randint(0, gw - 2)
-            y = random.randint(0, gh - 2)
+            x = randrange(gw - 1)
+            y = randrange(gh - 1)
 
             # build out rest of obstacle block
             block_cells = [
@@ -268,15 +508,18 @@ class Game:
             ]
 
             # check if cells in the obstacle block are valid
-            block_is_invalid = False
-            for cell in block_cells:
-                if cell in invalid_cells:
-                    block_is_invalid = True
-                    break
-            if block_is_invalid:
+            if not invalid_cells.isdisjoint(block_cells):
                 continue
-            for cell in block_cells:
-                self.obstacles.add(cell)
+            self.obstacles.update(block_cells)
+            # later blocks may not overlap this one
+            invalid_cells.update(block_cells)
+
+        # Obstacles do not move during a game, so the cells within 1 block of
+        # an obstacle can be ruled out for food once here.
+        obstacle_rows = [0] * gh
+        for ox, oy in self.obstacles:
+            obstacle_rows[oy] |= 1 << ox
+        self._static_blocked = _dilate(obstacle_rows)
 
     def step(self):
         """
@@ -297,66 +540,39 @@ class Game:
 
         # Allow one turn per step
         self.input_locked = False
-        self.direction = self.next_direction
 
-        # New head position
-        gw, gh = self.config.grid_width, self.config.grid_height
-        head = self.snake[0]
-        dx, dy = DIR[self.direction]
-        nx, ny = head[0] + dx, head[1] + dy
-
-        # Walls
-        if self.wrap_walls:
-            nx = nx % gw
-            ny = ny % gh
-            new_head = (nx, ny)
-        else:
-            new_head = (nx, ny)
-            # If snake hits a wall
-            if not self.is_inside(new_head):
-                if self.invincible:
-                    # bounce
-                    bounce_dir = OPP_DIR[self.direction]
-                    bdx, bdy = DIR[bounce_dir]
-                    bx, by = head[0] + bdx, head[1] + bdy
-                    bounce_cell = (bx, by)
-                    if self.is_inside(bounce_cell):
-                        self.direction = bounce_dir
-                        self.next_direction = bounce_dir
-                        new_head = bounce_cell
-                    else:
-                        return
-                else:
-                    self.game_over = True
-                    return
-
-        # If snake hits an obstacle
-        if new_head in self.obstacles:
-            if self.invincible:
-                bounce_dir = OPP_DIR[self.direction]
-                bdx, bdy = DIR[bounce_dir]
-                bx, by = head[0] + bdx, head[1] + bdy
-                if self.wrap_walls:
-                    bx = bx % gw
-                    by = by % gh
-                bounce_cell = (bx, by)
-                if (self.is_inside(bounce_cell)
-                        and bounce_cell not in self.obstacles):
-                    self.direction = bounce_dir
-                    self.next_direction = bounce_dir
-                    new_head = bounce_cell
-            else:
-                self.game_over = True
-                return
+        # Bind the attributes used below to locals, step() runs every tick
+        snake = self._snake
+        snake_set = self.snake_set
+        counts = self._segment_counts
+        config = self.config
 
-        # If snake hits itself
-        if new_head in self.snake:
-            if not self.invincible:
-                self.game_over = True
-                return
+        # New head position
+        new_head, d, hit = move_head(
+            snake[0],
+            self._next_dir,
+            config.grid_width,
+            config.grid_height,
+            self.wrap_walls,
+            self.invincible,
+            self.obstacles,
+            snake_set,
+        )
+        # A bounce changes both the current and the queued direction
+        self._dir = d
+        self._next_dir = d
+        if hit:
+            self.game_over = True
+            return
+        if new_head is None:
+            return
 
         # Move snake head
-        self.snake.insert(0, new_head)
+        snake.appendleft(new_head)
+        self.moves = self.moves + 1
+        snake_set.add(new_head)
+        counts[new_head] = counts.get(new_head, 0) + 1
+        self.row_bits[new_head[1]] |= 1 << new_head[0]
 
         # If snake hits food
         growth = 0
@@ -381,9 +597,40 @@ class Game:
             # from any growth
             self.new_growth = self.new_growth - 1
         else:
-            self.snake.pop()
+            tail = snake.pop()
+            # In invincible mode another segment may still cover the tail cell
+            remaining = counts[tail] - 1
+            if remaining:
+                counts[tail] = remaining
+            else:
+                del counts[tail]
+                snake_set.discard(tail)
+                self.row_bits[tail[1]] &= ~(1 << tail[0])
 
         # Generate a new power-up based on probability
         if (self.powerup_position is None
-                and random.random() < self.config.powerup_chance):
+                and self._rng.random() < config.powerup_chance):
             self.powerup_position = self.random_empty_cell()
+
+    def run(self, n_steps):
+        """
+        Advance the game by up to n_steps steps in a tight loop, independent
+        of the Tk event loop (e.g. for benchmarks, tests or AI training).
+        Stops early once the game is over.
+
+        Parameters
+        ----------
+        n_steps : int
+            Maximum number of steps to take.
+
+        Returns
+        -------
+        int
+            Number of steps actually taken.
+        """
+        step = self.step
+        for i in range(n_steps):
+            if self.game_over:
+                return i
+            step()
+        return n_steps
@@ -2,11 +2,16 @@
 Tkinter window for running and displaying the snake game.
 """
 
+import time
 import tkinter as tk
 from configuration import Configuration
 from game import Game
 from draw import Draw
 
+# When the loop falls further behind than this many ticks (e.g. the window
+# was stalled), the missed ticks are dropped instead of replayed.
+MAX_CATCH_UP_TICKS = 2
+
 
 class Combined(tk.Tk):
     """
@@ -25,6 +30,10 @@ class Combined(tk.Tk):
         tracker for game loop callback.
     paused : boolean
         True if the game is currently paused.
+    _last_score : int | None
+        Score currently shown on the score label.
+    _next_tick_ms : float
+        Monotonic time in milliseconds at which the current tick is due.
     score_label : tk.Label
         Label showing current score.
     status : tk.Label
@@ -64,6 +73,8 @@ class Combined(tk.Tk):
         self.config_obj = Configuration()
         self.next_step_call = None
         self.paused = False
+        self._last_score = None
+        self._next_tick_ms = time.monotonic() * 1000
 
         # Top bar with toggles/ controls
         top = tk.Frame(self)
@@ -157,11 +168,15 @@ class Combined(tk.Tk):
             self.status.config(text="Paused")
         else:
             self.status.config(text="Running")
+            # The scene is not redrawn while paused. Before Start is pressed
+            # there is no game running to redraw.
+            if self.next_step_call:
+                self.draw_obj.draw()
 
     def start_game(self):
         """
         Starts a new game. Cancels any existing game loop, creates a new
-        Game and GUI and starts the main loop.
+        Game, points the drawing layer at it and starts the main loop.
 
         Returns
         -------
@@ -174,17 +189,21 @@ class Combined(tk.Tk):
 
         self.paused = False
 
-        # New game drawing
+        # New game drawing, reusing the canvas items of the previous game
         self.game_obj = Game(
             self.config_obj,
             obstacles_enabled=self.obstacles_on.get(),
             wrap_walls=self.wrap_on.get(),
             invincible=self.invincible_on.get(),
         )
-        self.draw_obj = Draw(self.canvas, self.game_obj)
+        self.draw_obj.set_game(self.game_obj)
 
         self.status.config(text="Running")
         self.score_label.config(text=f"Score: {self.game_obj.score} ")
+        self._last_score = self.game_obj.score
+        self._next_tick_ms = time.monotonic() * 1000
+        # Obstacles do not move, so they are drawn once per game
+        self.draw_obj.draw_obstacles()
         self.draw_obj.draw()
 
         # Continue game_obj
@@ -193,28 +212,46 @@ class Combined(tk.Tk):
     def game_loop(self):
         """
         Advances the game by a step, redraws the view, updates score, and
-        sets to run again after the configured delay.
+        sets to run again after the configured delay. Nothing changes while
+        the game is paused, so the redraw is skipped then, and the score
+        label is only updated when the score changed.
+
+        Ticks are scheduled against a monotonic clock, so the time spent
+        stepping and drawing does not add up as drift. When a tick runs more
+        than a full step late, the game still steps but the redraw is skipped
+        so the loop can catch up. The tick that ends the game always redraws,
+        so the final state is shown even if the tick before it was late.
 
         Returns
         -------
         None
         """
+        step_delay = self.config_obj.step_delay
+        now = time.monotonic() * 1000
+        late = now - self._next_tick_ms >= step_delay
+
         if not self.paused:
             self.game_obj.step()
 
-        self.draw_obj.draw()
-        self.score_label.config(text=f"Score: {self.game_obj.score} ")
+        if self.game_obj.score != self._last_score:
+            self.score_label.config(text=f"Score: {self.game_obj.score} ")
+            self._last_score = self.game_obj.score
+
+        if not self.paused and (self.game_obj.game_over or not late):
+            self.draw_obj.draw()
 
         if self.game_obj.game_over:
             self.status.config(text="Game over")
             self.next_step_call = None
             return
 
-        # Schedule the next game tick after the configured delay
-        self.next_step_call = self.after(
-            self.config_obj.step_delay,
-            self.game_loop,
-        )
+        # Schedule the next game tick one step after this one was due
+        self._next_tick_ms = self._next_tick_ms + step_delay
+        now = time.monotonic() * 1000
+        if now - self._next_tick_ms > MAX_CATCH_UP_TICKS * step_delay:
+            self._next_tick_ms = now
+        delay = max(1, int(self._next_tick_ms - now))
+        self.next_step_call = self.after(delay, self.game_loop)
 
 
 if __name__ == "__main__":
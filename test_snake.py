@@ -1,7 +1,11 @@
+import io
+import random
 import unittest
+from contextlib import redirect_stdout
 
 from configuration import Configuration
-from game import Game
+from draw import Draw
+from game import Game, LEFT, RIGHT, move_head
 
 
 class TestGame(unittest.TestCase):
@@ -101,6 +105,270 @@ class TestGame(unittest.TestCase):
         game.step()
         self.assertTrue(game.game_over)
 
+    def test_row_bits_track_snake(self):
+        """
+        Row bitmasks follow the snake as it moves
+        """
+        self.game.food_position = (0, 0)
+        tail_x, tail_y = self.game.snake[-1]
+        self.game.step()
+        head_x, head_y = self.game.snake[0]
+
+        self.assertTrue(self.game.row_bits[head_y] >> head_x & 1)
+        self.assertFalse(self.game.row_bits[tail_y] >> tail_x & 1)
+
+    def test_overlapping_tail_stays_in_snake_set(self):
+        """
+        In invincible mode a tail cell still covered by another segment stays
+        marked as snake
+        """
+        game = Game(self.config, obstacles_enabled=False, invincible=True)
+        game.snake = [(3, 7), (4, 7), (3, 7)]
+        game.direction = "Left"
+        game.next_direction = "Left"
+        game.food_position = None
+        game.step()
+
+        self.assertEqual(list(game.snake), [(2, 7), (3, 7), (4, 7)])
+        self.assertEqual(game.snake_set, {(2, 7), (3, 7), (4, 7)})
+        self.assertTrue(game.row_bits[7] >> 3 & 1)
+
+    def test_obstacle_blocks_do_not_overlap(self):
+        """
+        Obstacle blocks never share cells
+        """
+        config = Configuration(obstacle_density=0.5)
+        for _ in range(20):
+            game = Game(config, obstacles_enabled=True)
+            self.assertEqual(len(game.obstacles) % 4, 0)
+
+    def valid_spawn_cells(self, game):
+        """
+        Spawn cells by the original rule: the cell and its neighbors hold no
+        snake, obstacle, food or power-up, away from the last row and column
+        """
+        occupied = set(game.snake) | set(game.obstacles)
+        for cell in (game.food_position, game.powerup_position):
+            if cell is not None:
+                occupied.add(cell)
+        valid = set()
+        for x in range(game.config.grid_width - 1):
+            for y in range(game.config.grid_height - 1):
+                if all((x + dx, y + dy) not in occupied
+                       for dx in (-1, 0, 1) for dy in (-1, 0, 1)):
+                    valid.add((x, y))
+        return valid
+
+    def test_random_empty_cell_is_valid(self):
+        """
+        Spawn cells follow the original rule across random games
+        """
+        rng = random.Random(0)
+        config = Configuration(obstacle_density=0.2, powerup_chance=0.2)
+        for trial in range(10):
+            game = Game(config, obstacles_enabled=trial % 2 == 0,
+                        wrap_walls=True, invincible=trial % 3 == 0)
+            for _ in range(200):
+                if rng.random() < 0.3:
+                    game.change_direction(
+                        rng.choice(["Up", "Down", "Left", "Right"]))
+                game.step()
+                if game.game_over:
+                    break
+                valid = self.valid_spawn_cells(game)
+                cell = game.random_empty_cell()
+                if valid:
+                    self.assertIn(cell, valid)
+                else:
+                    self.assertIsNone(cell)
+
+    def test_random_empty_cell_none_when_full(self):
+        """
+        No spawn cell is returned when every cell is next to the snake
+        """
+        self.game.snake = [(x, y) for x in (1, 4, 7, 10, 13)
+                           for y in (1, 4, 7, 10, 13)]
+        self.game.food_position = None
+        self.assertEqual(self.valid_spawn_cells(self.game), set())
+        with redirect_stdout(io.StringIO()):
+            self.assertIsNone(self.game.random_empty_cell())
+
+    def test_move_head_kernel(self):
+        """
+        Movement kernel bounces off walls when invincible and reports a
+        collision otherwise
+        """
+        head = (0, 7)
+        new_head, d, hit = move_head(head, LEFT, 15, 15, False, True,
+                                     set(), set())
+        self.assertEqual((new_head, d, hit), ((1, 7), RIGHT, False))
+
+        new_head, d, hit = move_head(head, LEFT, 15, 15, False, False,
+                                     set(), set())
+        self.assertTrue(hit)
+
+    def test_run_steps_headless(self):
+        """
+        run() advances several steps and stops once the game is over
+        """
+        game = Game(self.config, obstacles_enabled=False, wrap_walls=True)
+        game.food_position = None
+        self.assertEqual(game.run(20), 20)
+        self.assertFalse(game.game_over)
+
+        # Snake moving right hits the wall before 100 steps
+        self.game.food_position = None
+        self.assertLess(self.game.run(100), 100)
+        self.assertTrue(self.game.game_over)
+
+
+class FakeCanvas:
+    """
+    Minimal stand-in for tk.Canvas that records items, so drawing can be
+    tested without a display
+    """
+
+    def __init__(self):
+        self.items = {}
+        self.next_id = 0
+
+    def _create(self, kind, coords, kwargs):
+        self.next_id = self.next_id + 1
+        self.items[self.next_id] = {
+            "kind": kind,
+            "coords": list(coords),
+            "tags": kwargs.get("tags", ""),
+            "state": kwargs.get("state", "normal"),
+        }
+        return self.next_id
+
+    def create_rectangle(self, *coords, **kwargs):
+        return self._create("rectangle", coords, kwargs)
+
+    def create_oval(self, *coords, **kwargs):
+        return self._create("oval", coords, kwargs)
+
+    def create_text(self, *coords, **kwargs):
+        return self._create("text", coords, kwargs)
+
+    def coords(self, item, *coords):
+        self.items[item]["coords"] = list(coords)
+
+    def itemconfigure(self, item, **kwargs):
+        self.items[item].update(kwargs)
+
+    def delete(self, tag):
+        for item in [i for i, v in self.items.items() if v["tags"] == tag]:
+            del self.items[item]
+
+    def tag_lower(self, tag):
+        pass
+
+
+class TestDraw(unittest.TestCase):
+    """
+    Unit tests for the incremental drawing layer
+    """
+
+    def assert_snake_drawn(self, canvas, draw):
+        """
+        Visible snake ovals match the game's snake, with the head larger
+        """
+        game = draw.game
+        s = game.config.cell_size
+        expected = []
+        for i, (x, y) in enumerate(game.snake):
+            r = s * 0.5 if i == 0 else s * 0.4
+            cx, cy = x * s + s / 2, y * s + s / 2
+            expected.append((cx - r, cy - r, cx + r, cy + r))
+
+        # Every visible oval other than the food and power-up
+        others = (draw._food_item, draw._powerup_item)
+        drawn = [
+            tuple(item["coords"])
+            for i, item in canvas.items.items()
+            if item["kind"] == "oval" and item["state"] != "hidden"
+            and i not in others
+        ]
+        self.assertEqual(sorted(drawn), sorted(expected))
+
+    def test_obstacle_rects_cover_obstacles(self):
+        """
+        Merged obstacle rectangles cover exactly the obstacle cells, each
+        cell once
+        """
+        for density in (0.05, 0.2, 0.5):
+            config = Configuration(obstacle_density=density)
+            for _ in range(10):
+                game = Game(config, obstacles_enabled=True)
+                draw = Draw(FakeCanvas(), game)
+                covered = []
+                for x_start, y_start, x_end, y_end in (
+                        draw._compute_obstacle_rects()):
+                    for x in range(x_start, x_end + 1):
+                        for y in range(y_start, y_end + 1):
+                            covered.append((x, y))
+                self.assertEqual(len(covered), len(set(covered)))
+                self.assertEqual(set(covered), game.obstacles)
+
+    def test_bounce_after_skipped_frame(self):
+        """
+        Two steps between draws (a skipped frame) still redraw the snake
+        """
+        config = Configuration()
+        game = Game(config, obstacles_enabled=False, invincible=True)
+        game.snake = [(1, 7), (2, 7), (3, 7)]
+        game.direction = "Left"
+        game.next_direction = "Left"
+        game.food_position = None
+        canvas = FakeCanvas()
+        draw = Draw(canvas, game)
+        draw.draw()
+        game.step()
+        game.step()
+        draw.draw()
+        self.assert_snake_drawn(canvas, draw)
+
+    def test_assigned_snake_redrawn(self):
+        """
+        Assigning a new snake is redrawn without counting as a move
+        """
+        config = Configuration()
+        game = Game(config, obstacles_enabled=False)
+        canvas = FakeCanvas()
+        draw = Draw(canvas, game)
+        draw.draw()
+        game.snake = [(5, 3), (5, 4), (5, 5), (5, 6)]
+        self.assertEqual(game.moves, 0)
+        draw.draw()
+        self.assert_snake_drawn(canvas, draw)
+
+    def test_drawn_snake_matches_game(self):
+        """
+        Random games with skipped frames and game switches stay in sync
+        """
+        rng = random.Random(0)
+        config = Configuration(powerup_chance=0.1)
+        canvas = FakeCanvas()
+        game = Game(config, wrap_walls=True, invincible=True)
+        draw = Draw(canvas, game)
+        draw.draw_obstacles()
+        draw.draw()
+        for _ in range(10):
+            for _ in range(200):
+                game.change_direction(
+                    rng.choice(["Up", "Down", "Left", "Right"]))
+                game.step()
+                if rng.random() < 0.8:
+                    draw.draw()
+                    self.assert_snake_drawn(canvas, draw)
+            game = Game(config, wrap_walls=rng.random() < 0.5,
+                        invincible=True)
+            draw.set_game(game)
+            draw.draw_obstacles()
+            draw.draw()
+            self.assert_snake_drawn(canvas, draw)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)